@@ -10,6 +10,10 @@ class VideoDevice:
     def __init__(self, device_id: int = 0):
         self.device_id = device_id
         self.cap = None
+        self.width = 0
+        self.height = 0
+        self._ring = []
+        self._ring_idx = 0
         self._initialize()
 
     def _initialize(self) -> None:
@@ -18,38 +22,63 @@ class VideoDevice:
             if not self.cap.isOpened():
                 raise RuntimeError("Could not open webcam")
 
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 320)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 240)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
-            logger.info("Successfully initialized video capture")
+            self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+            self._ring = [
+                np.empty((self.height, self.width, 3), dtype=np.uint8)
+                for _ in range(3)
+            ]
+
+            logger.info(
+                f"Successfully initialized video capture: {self.width}x{self.height}"
+            )
 
         except Exception as e:
             logger.error(f"Failed to initialize video device: {e}")
             self.cleanup()
             raise
 
-    def read_frame(self) -> Optional[bytes]:
+    def read_frame(self) -> Optional[np.ndarray]:
         try:
             if self.cap is None:
                 return None
 
-            print("[Camera] Starting frame capture")
-            ret, frame = self.cap.read()
-            if not ret:
-                print("[Camera] Failed to capture frame")
+            logger.debug("Starting frame capture")
+            if not self.cap.grab():
+                logger.debug("Failed to capture frame")
                 return None
 
-            print(f"[Camera] Frame captured successfully: shape={frame.shape}")
-
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frame = frame.astype(np.float32) / 255.0
+            ret, frame = self.cap.retrieve(self._ring[self._ring_idx])
+            if not ret:
+                logger.debug("Failed to capture frame")
+                return None
 
-            return frame.tobytes()
+            logger.debug("Frame captured successfully: shape=%s", frame.shape)
+            self._ring[self._ring_idx] = frame
+            self._ring_idx = (self._ring_idx + 1) % len(self._ring)
+            return frame
 
         except Exception as e:
             logger.error(f"Failed to read frame: {e}")
             return None
 
+    def skip_frame(self) -> bool:
+        try:
+            if self.cap is None:
+                return False
+
+            return self.cap.grab()
+
+        except Exception as e:
+            logger.error(f"Failed to skip frame: {e}")
+            return False
+
     def cleanup(self) -> None:
         if self.cap is not None:
             self.cap.release()
@@ -3,23 +3,36 @@ from OpenGL.GL import shaders
 import numpy as np
 import logging
 import ctypes
-from memory_manager import MemoryPool
+import hashlib
+import os
+import struct
 from typing import Optional, Tuple
 import logging
-from performance_core import (
-    AsyncTextureManager,
-    TextureUpdateTask,
-    MemoryAlignment,
-    BufferSpec,
-    AlignedBuffer,
-)
-from memory_manager import MemoryPool, MemoryType, BufferSpec
+from memory_manager import MemoryType, BufferSpec
 
 logger = logging.getLogger(__name__)
 
+SHADER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "camera_framework")
+
+_QUAD_VERTICES = np.array(
+    [
+        [-1.0, 1.0, 0.0, 0.0],
+        [1.0, 1.0, 1.0, 0.0],
+        [-1.0, -1.0, 0.0, 1.0],
+        [1.0, -1.0, 1.0, 1.0],
+    ],
+    dtype=np.float32,
+)
+_QUAD_VERTICES.setflags(write=False)
+
+_QUAD_INDICES = np.array([0, 1, 2, 2, 1, 3], dtype=np.uint32)
+_QUAD_INDICES.setflags(write=False)
+
 
 class GLCore:
-    def __init__(self, width: int, height: int):
+    def __init__(
+        self, width: int, height: int, texture_size: Optional[Tuple[int, int]] = None
+    ):
         self.width = width
         self.height = height
         self.shader_program = None
@@ -27,12 +40,12 @@ class GLCore:
         self.vbo = None
         self.ebo = None
         self.texture_id = None
+        self.lut_texture_id = None
+        self.texture_width, self.texture_height = texture_size or (width, height)
+        self.pbos = None
+        self.pbo_size = 0
+        self.pbo_index = 0
 
-        self.vertex_pool = MemoryPool(
-            block_sizes=[4 * 16, 4 * 6, width * height * 3 * 4], blocks_per_size=2
-        )
-
-        self.texture_manager = AsyncTextureManager(max_workers=2)
         self._setup_gl()
 
     def _setup_gl(self) -> None:
@@ -46,6 +59,11 @@ class GLCore:
 
             self._setup_texture()
 
+            self._setup_tone_lut()
+
+            self._bind_static_state()
+
+            glClearColor(0.0, 0.0, 0.0, 1.0)
             glEnable(GL_BLEND)
             glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
@@ -61,24 +79,68 @@ class GLCore:
         self.texture_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, self.texture_id)
 
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
 
-        glTexImage2D(
-            GL_TEXTURE_2D,
-            0,
-            GL_RGB32F,
-            self.width,
-            self.height,
-            0,
-            GL_RGB,
-            GL_FLOAT,
-            None,
+        if bool(glTexStorage2D):
+            glTexStorage2D(
+                GL_TEXTURE_2D, 1, GL_RGB8, self.texture_width, self.texture_height
+            )
+        else:
+            glTexImage2D(
+                GL_TEXTURE_2D,
+                0,
+                GL_RGB8,
+                self.texture_width,
+                self.texture_height,
+                0,
+                GL_RGB,
+                GL_UNSIGNED_BYTE,
+                None,
+            )
+
+        self.pbo_size = self.texture_width * self.texture_height * 3
+        self.pbos = glGenBuffers(2)
+        for pbo in self.pbos:
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, pbo)
+            glBufferData(GL_PIXEL_UNPACK_BUFFER, self.pbo_size, None, GL_STREAM_DRAW)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+
+    def _setup_tone_lut(self) -> None:
+        gray = np.linspace(0.0, 1.0, 256, dtype=np.float32)
+        tone = np.power(gray * 0.75, 1.4)[:, np.newaxis]
+
+        shadow_tint = np.array([0.03, 0.03, 0.05], dtype=np.float32)
+        highlight_tint = np.array([0.80, 0.80, 0.85], dtype=np.float32)
+        tinted = shadow_tint + (highlight_tint - shadow_tint) * tone
+
+        lut = np.round(np.power(tinted, 1.2) * 255.0).astype(np.uint8)
+
+        self.lut_texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_1D, self.lut_texture_id)
+
+        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+
+        glTexImage1D(
+            GL_TEXTURE_1D, 0, GL_RGB8, len(lut), 0, GL_RGB, GL_UNSIGNED_BYTE, lut
         )
 
-        glGenerateMipmap(GL_TEXTURE_2D)
+    def _bind_static_state(self) -> None:
+        glUseProgram(self.shader_program)
+        glUniform1i(self.tex_location, 0)
+        glUniform1i(self.lut_location, 1)
+
+        glActiveTexture(GL_TEXTURE1)
+        glBindTexture(GL_TEXTURE_1D, self.lut_texture_id)
+        glActiveTexture(GL_TEXTURE0)
+        glBindTexture(GL_TEXTURE_2D, self.texture_id)
+
+        glBindVertexArray(self.vao)
 
     def _create_shader_program(self) -> None:
         vertex_source = """
@@ -96,112 +158,148 @@ class GLCore:
         fragment_source = """
         #version 330 core
         uniform sampler2D tex;
+        uniform sampler1D toneLUT;
         in vec2 v_texcoord;
         out vec4 fragColor;
         
+        const vec3 LUT_LUMA = vec3(0.299, 0.587, 0.114) * (255.0 / 256.0);
+        const float LUT_OFFSET = 0.5 / 256.0;
+        const float VIGNETTE_STRENGTH = 0.9;
+        const float OUTPUT_GAMMA = 1.2;
+        
         void main() {
-            vec3 color = texture(tex, v_texcoord).rgb;
-            float gray = dot(color, vec3(0.299, 0.587, 0.114));
-            gray *= 0.75;
-            gray = pow(gray, 1.4);
+            vec3 color = texture(tex, v_texcoord).bgr;
+            vec3 tinted = texture(toneLUT, dot(color, LUT_LUMA) + LUT_OFFSET).rgb;
             
             vec2 center = v_texcoord - 0.5;
-            float vignette = 1.0 - dot(center, center) * 0.9;
-            
-            vec3 shadowTint = vec3(0.03, 0.03, 0.05);
-            vec3 highlightTint = vec3(0.80, 0.80, 0.85);
-            vec3 tinted = mix(shadowTint, highlightTint, gray);
-            vec3 final = tinted * vignette;
-            final = pow(final, vec3(1.2));
+            float vignette = 1.0 - dot(center, center) * VIGNETTE_STRENGTH;
+            vec3 final = tinted * pow(vignette, OUTPUT_GAMMA);
             
             fragColor = vec4(final, 1.0);
         }
         """
 
         try:
-            vertex_shader = glCreateShader(GL_VERTEX_SHADER)
-            glShaderSource(vertex_shader, vertex_source)
-            glCompileShader(vertex_shader)
+            cache_path = self._shader_cache_path(vertex_source, fragment_source)
+            self.shader_program = self._load_program_binary(cache_path)
+
+            if self.shader_program is None:
+                vertex_shader = glCreateShader(GL_VERTEX_SHADER)
+                glShaderSource(vertex_shader, vertex_source)
+                glCompileShader(vertex_shader)
+
+                if not glGetShaderiv(vertex_shader, GL_COMPILE_STATUS):
+                    error = glGetShaderInfoLog(vertex_shader)
+                    raise RuntimeError(f"Vertex shader compilation failed: {error}")
 
-            if not glGetShaderiv(vertex_shader, GL_COMPILE_STATUS):
-                error = glGetShaderInfoLog(vertex_shader)
-                raise RuntimeError(f"Vertex shader compilation failed: {error}")
+                fragment_shader = glCreateShader(GL_FRAGMENT_SHADER)
+                glShaderSource(fragment_shader, fragment_source)
+                glCompileShader(fragment_shader)
 
-            fragment_shader = glCreateShader(GL_FRAGMENT_SHADER)
-            glShaderSource(fragment_shader, fragment_source)
-            glCompileShader(fragment_shader)
+                if not glGetShaderiv(fragment_shader, GL_COMPILE_STATUS):
+                    error = glGetShaderInfoLog(fragment_shader)
+                    raise RuntimeError(f"Fragment shader compilation failed: {error}")
 
-            if not glGetShaderiv(fragment_shader, GL_COMPILE_STATUS):
-                error = glGetShaderInfoLog(fragment_shader)
-                raise RuntimeError(f"Fragment shader compilation failed: {error}")
+                self.shader_program = glCreateProgram()
+                glAttachShader(self.shader_program, vertex_shader)
+                glAttachShader(self.shader_program, fragment_shader)
+                if cache_path is not None:
+                    glProgramParameteri(
+                        self.shader_program, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE
+                    )
+                glLinkProgram(self.shader_program)
 
-            self.shader_program = glCreateProgram()
-            glAttachShader(self.shader_program, vertex_shader)
-            glAttachShader(self.shader_program, fragment_shader)
-            glLinkProgram(self.shader_program)
+                if not glGetProgramiv(self.shader_program, GL_LINK_STATUS):
+                    error = glGetProgramInfoLog(self.shader_program)
+                    raise RuntimeError(f"Shader program linking failed: {error}")
 
-            if not glGetProgramiv(self.shader_program, GL_LINK_STATUS):
-                error = glGetProgramInfoLog(self.shader_program)
-                raise RuntimeError(f"Shader program linking failed: {error}")
+                glDeleteShader(vertex_shader)
+                glDeleteShader(fragment_shader)
 
-            glDeleteShader(vertex_shader)
-            glDeleteShader(fragment_shader)
+                self._store_program_binary(cache_path)
 
             self.tex_location = glGetUniformLocation(self.shader_program, "tex")
+            self.lut_location = glGetUniformLocation(self.shader_program, "toneLUT")
 
         except Exception as e:
             logger.error(f"Failed to create shader program: {e}")
             raise
 
-    def _setup_vertex_data(self) -> None:
+    def _shader_cache_path(self, *sources: str) -> Optional[str]:
+        if not (bool(glGetProgramBinary) and bool(glProgramBinary)):
+            return None
+
+        digest = hashlib.sha256()
+        for name in (GL_VENDOR, GL_RENDERER, GL_VERSION):
+            digest.update(glGetString(name) or b"")
+        for source in sources:
+            digest.update(source.encode())
+
+        return os.path.join(SHADER_CACHE_DIR, f"shader-{digest.hexdigest()[:16]}.bin")
+
+    def _load_program_binary(self, cache_path: Optional[str]) -> Optional[int]:
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+
+        program = None
         try:
-            vertices = np.array(
-                [
-                    -1.0,
-                    1.0,
-                    0.0,
-                    0.0,
-                    1.0,
-                    1.0,
-                    1.0,
-                    0.0,
-                    -1.0,
-                    -1.0,
-                    0.0,
-                    1.0,
-                    1.0,
-                    -1.0,
-                    1.0,
-                    1.0,
-                ],
-                dtype=np.float32,
-            )
+            with open(cache_path, "rb") as f:
+                data = f.read()
 
-            indices = np.array([0, 1, 2, 2, 1, 3], dtype=np.uint32)
+            (binary_format,) = struct.unpack_from("<I", data)
+            binary = data[4:]
 
-            vertex_view = self.vertex_pool.acquire(vertices.nbytes)
-            index_view = self.vertex_pool.acquire(indices.nbytes)
+            program = glCreateProgram()
+            glProgramBinary(program, binary_format, binary, len(binary))
+            if glGetProgramiv(program, GL_LINK_STATUS):
+                logger.info(f"Loaded cached shader program: {cache_path}")
+                return program
+
+        except Exception as e:
+            logger.warning(f"Failed to load cached shader program: {e}")
 
-            if vertex_view is None or index_view is None:
-                raise RuntimeError("Failed to acquire memory from pool")
+        if program:
+            glDeleteProgram(program)
+        return None
 
-            vertex_data = np.frombuffer(vertex_view, dtype=np.float32)
-            index_data = np.frombuffer(index_view, dtype=np.uint32)
-            np.copyto(vertex_data, vertices)
-            np.copyto(index_data, indices)
+    def _store_program_binary(self, cache_path: Optional[str]) -> None:
+        if cache_path is None:
+            return
 
+        try:
+            length = glGetProgramiv(self.shader_program, GL_PROGRAM_BINARY_LENGTH)
+            if not length:
+                return
+
+            written = np.zeros(1, dtype=np.int32)
+            binary_format = np.zeros(1, dtype=np.uint32)
+            binary = np.empty(length, dtype=np.uint8)
+            glGetProgramBinary(
+                self.shader_program, length, written, binary_format, binary
+            )
+
+            os.makedirs(SHADER_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                f.write(struct.pack("<I", int(binary_format[0])))
+                f.write(binary[: written[0]].tobytes())
+
+        except Exception as e:
+            logger.warning(f"Failed to cache shader program: {e}")
+
+    def _setup_vertex_data(self) -> None:
+        try:
             self.vbo = glGenBuffers(1)
             glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
             glBufferData(
-                GL_ARRAY_BUFFER, vertices.nbytes, vertex_data.tobytes(), GL_STATIC_DRAW
+                GL_ARRAY_BUFFER, _QUAD_VERTICES.nbytes, _QUAD_VERTICES, GL_STATIC_DRAW
             )
 
             self.ebo = glGenBuffers(1)
             glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ebo)
             glBufferData(
                 GL_ELEMENT_ARRAY_BUFFER,
-                indices.nbytes,
-                index_data.tobytes(),
+                _QUAD_INDICES.nbytes,
+                _QUAD_INDICES,
                 GL_STATIC_DRAW,
             )
 
@@ -211,63 +309,61 @@ class GLCore:
             glEnableVertexAttribArray(1)
             glVertexAttribPointer(1, 2, GL_FLOAT, GL_FALSE, 4 * 4, ctypes.c_void_p(8))
 
-            self.vertex_pool.release(vertices.nbytes, vertex_view)
-            self.vertex_pool.release(indices.nbytes, index_view)
-
         except Exception as e:
             logger.error(f"Failed to setup vertex data: {e}")
             raise
 
     def update_texture(self, frame_data: np.ndarray) -> None:
         try:
-            texture_view = self.vertex_pool.acquire(frame_data.nbytes)
-            if texture_view is None:
-                raise RuntimeError("Failed to acquire texture memory")
-
-            print("[GL] Copying frame data to GPU")
-            texture_data = np.frombuffer(texture_view, dtype=frame_data.dtype).reshape(
-                frame_data.shape
+            if frame_data.nbytes != self.pbo_size:
+                raise RuntimeError(
+                    f"Frame size {frame_data.nbytes} does not match texture size "
+                    f"{self.pbo_size}"
+                )
+
+            frame_data = np.ascontiguousarray(frame_data)
+            self.pbo_index = (self.pbo_index + 1) % 2
+
+            logger.debug("Copying frame data to GPU")
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self.pbos[self.pbo_index])
+            ptr = glMapBufferRange(
+                GL_PIXEL_UNPACK_BUFFER,
+                0,
+                self.pbo_size,
+                GL_MAP_WRITE_BIT
+                | GL_MAP_INVALIDATE_BUFFER_BIT
+                | GL_MAP_UNSYNCHRONIZED_BIT,
             )
-            np.copyto(texture_data, frame_data)
+            if not ptr:
+                glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+                raise RuntimeError("Failed to map pixel unpack buffer")
 
-            print("[GL] Uploading texture")
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
-            glTexImage2D(
+            ctypes.memmove(ptr, frame_data.ctypes.data, self.pbo_size)
+            glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+
+            logger.debug("Uploading texture")
+            glTexSubImage2D(
                 GL_TEXTURE_2D,
                 0,
-                GL_RGB32F,
-                self.width,
-                self.height,
                 0,
+                0,
+                self.texture_width,
+                self.texture_height,
                 GL_RGB,
-                GL_FLOAT,
-                texture_data.tobytes(),
+                GL_UNSIGNED_BYTE,
+                ctypes.c_void_p(0),
             )
-            print("[GL] Texture update complete")
-
-            self.vertex_pool.release(frame_data.nbytes, texture_view)
+            glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+            logger.debug("Texture update complete")
 
         except Exception as e:
             logger.error(f"Failed to update texture: {e}")
 
     def render(self) -> None:
         try:
-            print("[GL] Starting frame render")
-            glClear(GL_COLOR_BUFFER_BIT)
-            glClearColor(0.0, 0.0, 0.0, 1.0)
-
-            glUseProgram(self.shader_program)
-
-            glActiveTexture(GL_TEXTURE0)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
-            glUniform1i(self.tex_location, 0)
-
-            glBindVertexArray(self.vao)
+            logger.debug("Starting frame render")
             glDrawElements(GL_TRIANGLES, 6, GL_UNSIGNED_INT, None)
 
-            glBindVertexArray(0)
-            glUseProgram(0)
-
             error = glGetError()
             if error != GL_NO_ERROR:
                 logger.error(f"OpenGL error: {error}")
@@ -283,9 +379,10 @@ class GLCore:
                 glDeleteVertexArrays(1, [self.vao])
             if self.texture_id:
                 glDeleteTextures([self.texture_id])
-
-            self.vertex_pool.cleanup()
-            self.texture_manager.cleanup()
+            if self.lut_texture_id:
+                glDeleteTextures([self.lut_texture_id])
+            if self.pbos is not None:
+                glDeleteBuffers(2, self.pbos)
 
         except Exception as e:
             logger.error(f"Failed to clean up resources: {e}")
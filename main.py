@@ -1,6 +1,5 @@
 import pygame
 import sys
-import numpy as np
 from OpenGL.GL import *
 from OpenGL.GL import shaders
 import logging
@@ -8,7 +7,6 @@ from camera_capture import VideoDevice
 from gl_core import GLCore
 from texture_converter import TextureConverter
 import threading
-import queue
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,26 +32,26 @@ class CameraApp:
         pygame.display.set_caption("Camera Feed")
 
         self.camera = VideoDevice()
-        self.gl_core = GLCore(width, height)
-        self.converter = TextureConverter(width, height)
+        frame_size = (self.camera.width, self.camera.height)
+        self.gl_core = GLCore(width, height, texture_size=frame_size)
+        self.converter = TextureConverter(*frame_size)
 
-        self.frame_queue = queue.Queue(maxsize=2)
+        self._latest_frame = [None]
+        self.frame_ready = threading.Event()
         self.frame_thread = None
 
     def _process_frames(self):
         while self.running:
             try:
-                frame_data = self.camera.read_frame()
-                if frame_data is not None:
-                    print("[Converter] Starting frame conversion")
-                    frame_array = np.frombuffer(frame_data, dtype=np.float32)
-                    frame_array = frame_array.reshape((480, 640, 3))
-                    print("[Converter] Processing RGB format")
-                    print("[Converter] Conversion complete")
-
-                    if not self.frame_queue.full():
-                        print("[GL] Starting texture update")
-                        self.frame_queue.put(frame_array)
+                if self._latest_frame[0] is not None:
+                    self.camera.skip_frame()
+                    continue
+
+                frame_array = self.camera.read_frame()
+                if frame_array is not None:
+                    logger.debug("Queueing frame for texture update")
+                    self._latest_frame[0] = frame_array
+                    self.frame_ready.set()
             except Exception as e:
                 logger.error(f"Frame processing error: {e}")
                 continue
@@ -66,7 +64,7 @@ class CameraApp:
             self.frame_thread.daemon = True
             self.frame_thread.start()
 
-            clock = pygame.time.Clock()
+            needs_redraw = True
             while self.running:
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
@@ -77,18 +75,25 @@ class CameraApp:
                     elif event.type == pygame.VIDEORESIZE:
                         self.width, self.height = event.size
                         self.gl_core.resize(self.width, self.height)
+                        needs_redraw = True
+                    elif event.type == pygame.VIDEOEXPOSE:
+                        needs_redraw = True
 
                 try:
-                    if not self.frame_queue.empty():
-                        frame = self.frame_queue.get_nowait()
+                    self.frame_ready.wait(timeout=0.016)
+                    self.frame_ready.clear()
+
+                    frame = self._latest_frame[0]
+                    if frame is not None:
+                        self._latest_frame[0] = None
                         self.gl_core.update_texture(frame)
+                        needs_redraw = True
 
-                    self.gl_core.render()
-                    pygame.display.flip()
-                    clock.tick(60)
+                    if needs_redraw:
+                        self.gl_core.render()
+                        pygame.display.flip()
+                        needs_redraw = False
 
-                except queue.Empty:
-                    continue
                 except Exception as e:
                     logger.error(f"Render error: {e}")
                     continue
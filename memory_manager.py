@@ -27,97 +27,108 @@ class BufferSpec:
     name: str = "unnamed"
 
 
-class MemoryBlock:
+class Arena:
     def __init__(self, size: int, alignment: int):
         self.size = size
         self.alignment = alignment
-        self.raw_ptr: Optional[int] = None
-        self.aligned_ptr: Optional[int] = None
         self.buffer: Optional[mmap.mmap] = None
+        self.view: Optional[memoryview] = None
         self._allocate()
 
     def _allocate(self) -> None:
         try:
-            total_size = self.size + self.alignment
-
             self.buffer = mmap.mmap(
                 -1,
-                total_size,
+                self.size + self.alignment,
                 flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS,
                 prot=mmap.PROT_READ | mmap.PROT_WRITE,
             )
 
-            self.raw_ptr = ctypes.addressof(ctypes.c_void_p.from_buffer(self.buffer))
-
+            raw_ptr = ctypes.addressof(ctypes.c_void_p.from_buffer(self.buffer))
             mask = self.alignment - 1
-            self.aligned_ptr = (self.raw_ptr + mask) & ~mask
+            offset = ((raw_ptr + mask) & ~mask) - raw_ptr
+            self.view = memoryview(self.buffer)[offset : offset + self.size]
 
         except Exception as e:
-            logger.error(f"Failed to allocate memory block: {e}")
+            logger.error(f"Failed to allocate memory arena: {e}")
             self.cleanup()
             raise
 
-    def get_view(self) -> memoryview:
-        if not self.buffer:
-            raise RuntimeError("Buffer not allocated")
-
-        offset = self.aligned_ptr - self.raw_ptr
-        return memoryview(self.buffer)[offset : offset + self.size]
-
     def cleanup(self) -> None:
+        if self.view is not None:
+            self.view.release()
+            self.view = None
         if self.buffer:
             self.buffer.close()
             self.buffer = None
-            self.raw_ptr = None
-            self.aligned_ptr = None
+
+
+class MemoryBlock:
+    def __init__(self, arena: Arena, offset: int, size: int):
+        self.arena = arena
+        self.offset = offset
+        self.size = size
+
+    def get_view(self) -> memoryview:
+        if self.arena.view is None:
+            raise RuntimeError("Buffer not allocated")
+
+        return self.arena.view[self.offset : self.offset + self.size]
 
 
 class MemoryPool:
-    def __init__(self, block_sizes: List[int], blocks_per_size: int = 4):
+    def __init__(
+        self, block_sizes: List[int], blocks_per_size: int = 4, alignment: int = 256
+    ):
         self.blocks: Dict[int, List[MemoryBlock]] = {}
-        self.in_use: Dict[int, List[bool]] = {}
+        self.free_stack: Dict[int, List[int]] = {}
+        self.block_by_view_id: Dict[int, Dict[int, int]] = {}
         self.lock = threading.Lock()
 
+        mask = alignment - 1
+        strides = {size: (size + mask) & ~mask for size in block_sizes}
+        self.arena = Arena(sum(strides.values()) * blocks_per_size, alignment)
+
+        offset = 0
         for size in block_sizes:
             self.blocks[size] = []
-            self.in_use[size] = []
             for _ in range(blocks_per_size):
-                block = MemoryBlock(size, 256)
-                self.blocks[size].append(block)
-                self.in_use[size].append(False)
+                self.blocks[size].append(MemoryBlock(self.arena, offset, size))
+                offset += strides[size]
+            self.free_stack[size] = list(range(blocks_per_size))
+            self.block_by_view_id[size] = {}
 
     def acquire(self, size: int) -> Optional[memoryview]:
         with self.lock:
-            print(f"[Memory] Requesting block of size {size}")
-            if size not in self.blocks:
-                print(f"[Memory] No pool for size {size}")
+            logger.debug("Requesting block of size %d", size)
+            free_stack = self.free_stack.get(size)
+            if free_stack is None:
+                logger.debug("No pool for size %d", size)
                 return None
 
-            for i, in_use in enumerate(self.in_use[size]):
-                if not in_use:
-                    self.in_use[size][i] = True
-                    print(f"[Memory] Allocated block {i}")
-                    return self.blocks[size][i].get_view()
+            if not free_stack:
+                logger.warning(f"No available blocks for size {size}")
+                return None
 
-            logger.warning(f"No available blocks for size {size}")
-            return None
+            idx = free_stack.pop()
+            view = self.blocks[size][idx].get_view()
+            self.block_by_view_id[size][id(view)] = idx
+            logger.debug("Allocated block %d", idx)
+            return view
 
     def release(self, size: int, view: memoryview) -> None:
         with self.lock:
-            if size not in self.blocks:
+            views = self.block_by_view_id.get(size)
+            if views is None:
                 return
 
-            for i, block in enumerate(self.blocks[size]):
-                if block.aligned_ptr == ctypes.addressof(
-                    ctypes.c_void_p.from_buffer(view.obj)
-                ):
-                    self.in_use[size][i] = False
-                    break
+            idx = views.pop(id(view), None)
+            if idx is not None:
+                self.free_stack[size].append(idx)
 
     def cleanup(self) -> None:
         with self.lock:
-            for size_blocks in self.blocks.values():
-                for block in size_blocks:
-                    block.cleanup()
+            self.arena.cleanup()
             self.blocks.clear()
-            self.in_use.clear()
+            self.free_stack.clear()
+            self.block_by_view_id.clear()
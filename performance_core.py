@@ -101,18 +101,18 @@ class AsyncTextureManager:
 
     def _update_texture_data(self, task: TextureUpdateTask) -> None:
         try:
-            print("[Performance] Starting async texture update")
+            logger.debug("Starting async texture update")
             buffer_spec = BufferSpec(
                 size=task.data.nbytes,
                 alignment=MemoryAlignment.ALIGN_256,
                 usage="texture",
             )
 
-            print("[Performance] Creating aligned buffer")
+            logger.debug("Creating aligned buffer")
             aligned_buffer = AlignedBuffer(buffer_spec)
             buffer_view = aligned_buffer.get_buffer()
 
-            print("[Performance] Copying texture data")
+            logger.debug("Copying texture data")
             np.copyto(
                 np.frombuffer(buffer_view, dtype=task.data.dtype).reshape(
                     task.data.shape
@@ -120,7 +120,7 @@ class AsyncTextureManager:
                 task.data,
             )
 
-            print("[Performance] Async update complete")
+            logger.debug("Async update complete")
             self.update_queue.task_done()
 
         except Exception as e:
@@ -5,6 +5,7 @@ import logging
 import subprocess
 from typing import Optional, Dict
 import cv2
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -20,15 +21,17 @@ class RawCamera:
 
     def _initialize_device(self) -> None:
         try:
-            if self.system == "Darwin":
-                self._initialize_macos()
-            elif self.system == "Linux":
-                self._initialize_linux()
-            elif self.system == "Windows":
-                self._initialize_windows()
-            else:
+            initializers = {
+                "Darwin": self._initialize_macos,
+                "Linux": self._initialize_linux,
+                "Windows": self._initialize_windows,
+            }
+            initialize = initializers.get(self.system)
+            if initialize is None:
                 raise RuntimeError(f"Unsupported operating system: {self.system}")
 
+            initialize()
+
         except Exception as e:
             logger.error(f"Failed to initialize camera: {e}")
             self.cleanup()
@@ -80,80 +83,22 @@ class RawCamera:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize camera on Windows: {e}")
 
-    def read_frame(self) -> Optional[bytes]:
-        try:
-            if self.system == "Darwin":
-                return self._read_frame_macos()
-            elif self.system == "Linux":
-                return self._read_frame_linux()
-            elif self.system == "Windows":
-                return self._read_frame_windows()
-
-        except Exception as e:
-            logger.error(f"Failed to read frame: {e}")
-            return None
-
-    def _read_frame_macos(self) -> Optional[bytes]:
+    def read_frame(self) -> Optional[np.ndarray]:
         try:
             if self.cap is None:
                 return None
 
-            print("[Camera] Starting frame capture")
+            logger.debug("Starting frame capture")
             ret, frame = self.cap.read()
             if not ret:
-                print("[Camera] Failed to capture frame")
+                logger.debug("Failed to capture frame")
                 return None
 
-            print(f"[Camera] Frame captured successfully: shape={frame.shape}")
-            return frame.tobytes()
+            logger.debug("Frame captured successfully: shape=%s", frame.shape)
+            return frame
 
         except Exception as e:
-            logger.error(f"[Camera] Failed to read read frame: {e}")
-            return None
-
-    def _read_frame_linux(self) -> Optional[bytes]:
-        try:
-            if self.cap is None:
-                self.cap = cv2.VideoCapture(self.device_id)
-                if not self.cap.isOpened():
-                    raise RuntimeError("[Camera] Failed to open camera (Linux)")
-
-            print("[Camera] Srarting frame capture (Linux)")
-            ret, frame = self.cap.read()
-            if not ret:
-                print("[Camera] Failed to capture frame")
-                return None
-
-            print(f"[Camera] Frame captured successfully (Linux): shape={frame.shape}")
-            return frame.tobytes()
-
-        except Exception as e:
-            logger.error(f"[Camera] Failed to read read frame (Linux): {e}")
-            return None
-
-    def _read_frame_windows(self) -> Optional[bytes]:
-        try:
-            if self.cap is None:
-                self.cap = cv2.VideoCapture(self.device_id)
-                if not self.cap.isOpened():
-                    raise RuntimeError("Could not open camera")
-
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-
-            print("[Camera] Starting frame capture (Windows)")
-            ret, frame = self.cap.read()
-            if not ret:
-                print("[Camera] Failed to capture frame (Windows)")
-                return None
-
-            print(
-                f"[Camera] Frame captured successfully (Windows): shape={frame.shape}"
-            )
-            return frame.tobytes()
-
-        except Exception as e:
-            logger.error(f"[Camera] Failed to read read frame (Windows): {e}")
+            logger.error(f"Failed to read frame: {e}")
             return None
 
     def start_streaming(self) -> None:
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+import texture_converter as tc
+from texture_converter import TextureConverter
+
+
+def test_unknown_input_format_raises_value_error():
+    with pytest.raises(ValueError, match="nv12"):
+        TextureConverter(4, 2, input_format="nv12")
+
+
+@pytest.mark.parametrize("input_format", [None, "rgb"])
+def test_process_frame_accepts_bgr_bytes(input_format):
+    bgr = np.arange(2 * 4 * 3, dtype=np.uint8).reshape(2, 4, 3)
+    converter = TextureConverter(4, 2, input_format=input_format)
+
+    success, rgb = converter.process_frame(bgr.tobytes())
+
+    assert success
+    assert rgb.shape == (2, 4, 3)
+    np.testing.assert_allclose(rgb, bgr[:, :, ::-1] / 255.0, atol=1e-6)
+
+
+def _reference_yuyv_to_rgb(yuv):
+    height, width, _ = yuv.shape
+    rgb = np.empty((height, width, 3), dtype=np.float32)
+    for i in range(height):
+        for j in range(width):
+            y = (int(yuv[i, j, 0]) - 16) * tc._FIX_Y + tc._FIX_ROUND
+            u = int(yuv[i, j & ~1, 1]) - 128
+            v = int(yuv[i, j | 1, 1]) - 128 if j | 1 < width else 0
+            r = (y + tc._FIX_RV * v) >> tc._FIX_SHIFT
+            g = (y - tc._FIX_GU * u - tc._FIX_GV * v) >> tc._FIX_SHIFT
+            b = (y + tc._FIX_BU * u) >> tc._FIX_SHIFT
+            rgb[i, j] = [min(max(x, 0), 255) / 255.0 for x in (r, g, b)]
+    return rgb
+
+
+@pytest.mark.parametrize("width", [6, 7])
+def test_process_frame_converts_yuyv(width):
+    rng = np.random.default_rng(0)
+    yuv = rng.integers(0, 256, size=(3, width, 2), dtype=np.uint8)
+    converter = TextureConverter(width, 3, input_format="yuyv")
+
+    success, rgb = converter.process_frame(yuv.tobytes())
+
+    assert success
+    np.testing.assert_allclose(rgb, _reference_yuyv_to_rgb(yuv), atol=1e-6)
+
+
+@pytest.mark.parametrize("out_dtype", [np.float16, np.uint8])
+def test_process_frame_emits_requested_dtype(out_dtype):
+    bgr = np.arange(2 * 4 * 3, dtype=np.uint8).reshape(2, 4, 3)
+    converter = TextureConverter(4, 2, out_dtype=out_dtype)
+
+    success, rgb = converter.process_frame(bgr)
+
+    assert success
+    assert rgb.dtype == out_dtype
+    expected = bgr[:, :, ::-1]
+    if out_dtype != np.uint8:
+        expected = (expected / 255.0).astype(out_dtype)
+    np.testing.assert_array_equal(rgb, expected)
@@ -1,55 +1,369 @@
 import numpy as np
-from typing import Tuple
+from typing import Callable, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    from numba import cuda
+
+    if not cuda.is_available():
+        cuda = None
+except Exception:
+    cuda = None
+
+_FIX_SHIFT = 14
+_FIX_ROUND = 1 << (_FIX_SHIFT - 1)
+
+
+def _to_fixed(coefficient: float) -> int:
+    return int(round(coefficient * (1 << _FIX_SHIFT)))
+
+
+_FIX_Y = _to_fixed(255.0 / 219.0)
+_FIX_RV = _to_fixed(1.402 * 255.0 / 224.0)
+_FIX_GU = _to_fixed(0.344136 * 255.0 / 224.0)
+_FIX_GV = _to_fixed(0.714136 * 255.0 / 224.0)
+_FIX_BU = _to_fixed(1.772 * 255.0 / 224.0)
+
+_LUT_Y = (np.arange(256, dtype=np.int32) - 16) * _FIX_Y + _FIX_ROUND
+_CHROMA = np.arange(256, dtype=np.int32) - 128
+_LUT_RV = _CHROMA * _FIX_RV
+_LUT_GU = _CHROMA * _FIX_GU
+_LUT_GV = _CHROMA * _FIX_GV
+_LUT_BU = _CHROMA * _FIX_BU
+
+_KERNEL_DTYPES = (np.dtype(np.float32), np.dtype(np.uint8))
+
+
+def _build_out_lut(dtype: np.dtype) -> np.ndarray:
+    if dtype == np.uint8:
+        return np.arange(256, dtype=np.uint8)
+    return (np.arange(256) / 255.0).astype(dtype)
+
+
+_PARALLEL_MIN_PIXELS = 640 * 480
+_CUDA_MIN_PIXELS = 1280 * 720
+_CUDA_BLOCK = (16, 16)
+
+if njit is not None:
+
+    @njit(inline="always", fastmath=True, nogil=True, cache=True)
+    def _store_rgb(
+        out: np.ndarray, j: int, y: int, rv: int, guv: int, bu: int, lut: np.ndarray
+    ) -> None:
+        out[j, 0] = lut[min(max((y + rv) >> _FIX_SHIFT, 0), 255)]
+        out[j, 1] = lut[min(max((y - guv) >> _FIX_SHIFT, 0), 255)]
+        out[j, 2] = lut[min(max((y + bu) >> _FIX_SHIFT, 0), 255)]
+
+    @njit(inline="always", fastmath=True, nogil=True, cache=True)
+    def _yuyv_to_rgb_row(yuv: np.ndarray, lut: np.ndarray, out: np.ndarray) -> None:
+        width = yuv.shape[0]
+        for j in range(0, width - 1, 2):
+            u = np.int32(yuv[j, 1]) - 128
+            v = np.int32(yuv[j + 1, 1]) - 128
+            rv = _FIX_RV * v
+            guv = _FIX_GU * u + _FIX_GV * v
+            bu = _FIX_BU * u
+
+            y0 = (np.int32(yuv[j, 0]) - 16) * _FIX_Y + _FIX_ROUND
+            y1 = (np.int32(yuv[j + 1, 0]) - 16) * _FIX_Y + _FIX_ROUND
+            _store_rgb(out, j, y0, rv, guv, bu, lut)
+            _store_rgb(out, j + 1, y1, rv, guv, bu, lut)
+
+        if width & 1:
+            j = width - 1
+            u = np.int32(yuv[j, 1]) - 128
+            y = (np.int32(yuv[j, 0]) - 16) * _FIX_Y + _FIX_ROUND
+            _store_rgb(out, j, y, 0, _FIX_GU * u, _FIX_BU * u, lut)
+
+    @njit(fastmath=True, nogil=True, cache=True)
+    def _yuyv_to_rgb_serial(yuv: np.ndarray, lut: np.ndarray, out: np.ndarray) -> None:
+        for i in range(yuv.shape[0]):
+            _yuyv_to_rgb_row(yuv[i], lut, out[i])
+
+    @njit(parallel=True, fastmath=True, nogil=True, cache=True)
+    def _yuyv_to_rgb_parallel(
+        yuv: np.ndarray, lut: np.ndarray, out: np.ndarray
+    ) -> None:
+        for i in prange(yuv.shape[0]):
+            _yuyv_to_rgb_row(yuv[i], lut, out[i])
+
+    @njit(inline="always", fastmath=True, nogil=True, cache=True)
+    def _bgr_to_rgb_row(bgr: np.ndarray, lut: np.ndarray, out: np.ndarray) -> None:
+        for j in range(bgr.shape[0]):
+            out[j, 0] = lut[bgr[j, 2]]
+            out[j, 1] = lut[bgr[j, 1]]
+            out[j, 2] = lut[bgr[j, 0]]
+
+    @njit(fastmath=True, nogil=True, cache=True)
+    def _bgr_to_rgb_serial(bgr: np.ndarray, lut: np.ndarray, out: np.ndarray) -> None:
+        for i in range(bgr.shape[0]):
+            _bgr_to_rgb_row(bgr[i], lut, out[i])
+
+    @njit(parallel=True, fastmath=True, nogil=True, cache=True)
+    def _bgr_to_rgb_parallel(
+        bgr: np.ndarray, lut: np.ndarray, out: np.ndarray
+    ) -> None:
+        for i in prange(bgr.shape[0]):
+            _bgr_to_rgb_row(bgr[i], lut, out[i])
+else:
+    _yuyv_to_rgb_serial = _yuyv_to_rgb_parallel = None
+    _bgr_to_rgb_serial = _bgr_to_rgb_parallel = None
+
+if cuda is not None:
+
+    @cuda.jit(fastmath=True)
+    def _yuyv_to_rgb_cuda(yuv: np.ndarray, lut: np.ndarray, out: np.ndarray) -> None:
+        k, i = cuda.grid(2)
+        j = k * 2
+        width = yuv.shape[1]
+        if i >= yuv.shape[0] or j >= width:
+            return
+
+        yuv_row = yuv[i]
+        out_row = out[i]
+        end = min(j + 2, width)
+        u = np.int32(yuv_row[j, 1]) - 128
+        v = np.int32(yuv_row[j + 1, 1]) - 128 if end - j == 2 else 0
+        rv = _FIX_RV * v
+        guv = _FIX_GU * u + _FIX_GV * v
+        bu = _FIX_BU * u
+
+        for p in range(j, end):
+            y = (np.int32(yuv_row[p, 0]) - 16) * _FIX_Y + _FIX_ROUND
+            out_row[p, 0] = lut[min(max((y + rv) >> _FIX_SHIFT, 0), 255)]
+            out_row[p, 1] = lut[min(max((y - guv) >> _FIX_SHIFT, 0), 255)]
+            out_row[p, 2] = lut[min(max((y + bu) >> _FIX_SHIFT, 0), 255)]
+
 
 class TextureConverter:
-    def __init__(self, width: int, height: int):
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        input_format: Optional[str] = None,
+        out_dtype: np.dtype = np.float32,
+    ):
         self.width = width
         self.height = height
         self.frame_size = width * height * 3
+        self._yuv_size = width * height * 2
+        self._yuv_shape = (height, width, 2)
+        self._rgb_shape = (height, width, 3)
+        # Frames are always emitted in RGB order, including uint8 output. GLCore
+        # expects BGR bytes and swaps channels in its shader, so do not upload
+        # converter output to it directly.
+        self.out_dtype = np.dtype(out_dtype)
+        self._out_lut = _build_out_lut(self.out_dtype)
+        self._rgb_out = np.empty((height, width, 3), dtype=self.out_dtype)
+        self._rgb_u8 = np.empty((height, width, 3), dtype=np.uint8)
+        if self.out_dtype in _KERNEL_DTYPES:
+            self._kernel_lut = self._out_lut
+            self._kernel_out = None
+        else:
+            self._kernel_lut = _build_out_lut(np.dtype(np.uint8))
+            self._kernel_out = self._rgb_u8
+        self._zero_frame = np.zeros((height, width, 3), dtype=self.out_dtype)
+        self._zero_frame.setflags(write=False)
+
+        if width * height >= _PARALLEL_MIN_PIXELS:
+            self._yuyv_kernel = _yuyv_to_rgb_parallel
+            self._bgr_kernel = _bgr_to_rgb_parallel
+        else:
+            self._yuyv_kernel = _yuyv_to_rgb_serial
+            self._bgr_kernel = _bgr_to_rgb_serial
+
+        if self._yuyv_kernel is None:
+            pairs = (width + 1) // 2
+            self._fix_scratch = np.zeros((2, height, pairs * 2), dtype=np.int32)
+            self._chroma_scratch = np.zeros((4, height, pairs), dtype=np.int32)
+
+        self._cuda_stream = None
+        if cuda is not None and width * height >= _CUDA_MIN_PIXELS:
+            self._setup_cuda()
+
+        self._handlers = {
+            self._yuv_size: (self._yuv_shape, self._handle_yuv),
+            self.frame_size: (self._rgb_shape, self._handle_rgb),
+        }
+        self._formats = {
+            "yuyv": self._handlers[self._yuv_size],
+            "rgb": self._handlers[self.frame_size],
+        }
+        if input_format is not None:
+            self.process_frame = self._make_process_frame(input_format)
+
+        self._warm_kernels(input_format)
 
-    def process_frame(self, frame_data: bytes) -> Tuple[bool, np.ndarray]:
+    def _warm_kernels(self, input_format: Optional[str]) -> None:
+        kernels = {"yuyv": (self._yuyv_kernel, 2), "rgb": (self._bgr_kernel, 3)}
+        if self._cuda_stream is not None:
+            kernels["yuyv"] = (None, 2)
+        if input_format is not None:
+            kernels = {input_format: kernels[input_format]}
+
+        out = np.empty((2, 2, 3), dtype=self._kernel_lut.dtype)
+        for kernel, channels in kernels.values():
+            if kernel is None:
+                continue
+            frame = np.zeros((2, 2, channels), dtype=np.uint8)
+            readonly = np.frombuffer(frame.tobytes(), dtype=np.uint8)
+            for src in (frame, readonly.reshape(frame.shape)):
+                kernel(src, self._kernel_lut, out)
+
+    def _setup_cuda(self) -> None:
         try:
-            print("[Converter] Starting frame conversion")
-            frame_array = np.frombuffer(frame_data, dtype=np.uint8)
-
-            if len(frame_array) == 230400:
-                print("[Converter] Processing YUV format")
-                frame_array = frame_array.reshape((self.height, self.width, 2))
-                return True, self._yuv_to_rgb(frame_array)
-            elif len(frame_array) == self.width * self.height * 3:
-                print("[Converter] Processing RGB format")
-                frame_array = frame_array.reshape((self.height, self.width, 3))
-                frame_array = frame_array[:, :, ::-1].copy()
-                print("[Converter] Conversion complete")
-                return True, frame_array.astype(np.float32) / 255.0
+            shape = (self.height, self.width)
+            self._cuda_stream = cuda.stream()
+            self._cuda_yuv_host = cuda.pinned_array(shape + (2,), dtype=np.uint8)
+            self._cuda_yuv = cuda.device_array(shape + (2,), dtype=np.uint8)
+            self._cuda_out = cuda.device_array(
+                shape + (3,), dtype=self._kernel_lut.dtype
+            )
+            self._cuda_lut = cuda.to_device(self._kernel_lut)
+            self._cuda_grid = (
+                ((self.width + 1) // 2 + _CUDA_BLOCK[0] - 1) // _CUDA_BLOCK[0],
+                (self.height + _CUDA_BLOCK[1] - 1) // _CUDA_BLOCK[1],
+            )
+            self._rgb_out = cuda.pinned_array(shape + (3,), dtype=self.out_dtype)
+            if self._kernel_out is not None:
+                self._kernel_out = cuda.pinned_array(shape + (3,), dtype=np.uint8)
+
+        except Exception as e:
+            logger.warning(f"CUDA conversion unavailable, using CPU: {e}")
+            self._cuda_stream = None
+
+    def _make_process_frame(
+        self, input_format: str
+    ) -> Callable[[Union[bytes, np.ndarray]], Tuple[bool, np.ndarray]]:
+        if input_format not in self._formats:
+            raise ValueError(
+                f"Unsupported input format {input_format!r}, "
+                f"expected one of {sorted(self._formats)}"
+            )
+
+        shape, handler = self._formats[input_format]
+
+        def process_frame(
+            frame_data: Union[bytes, np.ndarray]
+        ) -> Tuple[bool, np.ndarray]:
+            try:
+                if isinstance(frame_data, np.ndarray):
+                    return handler(frame_data.reshape(shape))
+                return handler(np.frombuffer(frame_data, dtype=np.uint8).reshape(shape))
+
+            except Exception as e:
+                logger.error(f"Failed to process {input_format} frame: {e}")
+                return False, self._zero_frame
+
+        return process_frame
+
+    def process_frame(
+        self, frame_data: Union[bytes, np.ndarray]
+    ) -> Tuple[bool, np.ndarray]:
+        try:
+            logger.debug("Starting frame conversion")
+            if isinstance(frame_data, np.ndarray):
+                frame_array = frame_data.reshape(-1)
             else:
+                frame_array = np.frombuffer(frame_data, dtype=np.uint8)
+
+            entry = self._handlers.get(len(frame_array))
+            if entry is None:
                 logger.error(f"Unexpected frame size: {len(frame_array)}")
-                return False, np.zeros((self.height, self.width, 3), dtype=np.float32)
+                return False, self._zero_frame
+
+            shape, handler = entry
+            return handler(frame_array.reshape(shape))
 
         except Exception as e:
             logger.error(f"Failed to process frame: {e}")
-            return False, np.zeros((self.height, self.width, 3), dtype=np.float32)
+            return False, self._zero_frame
+
+    def _handle_yuv(self, frame_array: np.ndarray) -> Tuple[bool, np.ndarray]:
+        logger.debug("Processing YUV format")
+        return self._yuv_to_rgb(frame_array)
+
+    def _run_kernel(
+        self, kernel: Callable[..., None], frame_array: np.ndarray
+    ) -> np.ndarray:
+        if self._kernel_out is None:
+            kernel(frame_array, self._kernel_lut, self._rgb_out)
+        else:
+            kernel(frame_array, self._kernel_lut, self._kernel_out)
+            np.take(self._out_lut, self._kernel_out, out=self._rgb_out, mode="clip")
+        return self._rgb_out
+
+    def _handle_rgb(self, frame_array: np.ndarray) -> Tuple[bool, np.ndarray]:
+        logger.debug("Processing RGB format")
+        if self._bgr_kernel is not None:
+            self._run_kernel(self._bgr_kernel, frame_array)
+            logger.debug("Conversion complete")
+            return True, self._rgb_out
+
+        self._rgb_out[:, :, 0] = self._out_lut[frame_array[:, :, 2]]
+        self._rgb_out[:, :, 1] = self._out_lut[frame_array[:, :, 1]]
+        self._rgb_out[:, :, 2] = self._out_lut[frame_array[:, :, 0]]
+        logger.debug("Conversion complete")
+        return True, self._rgb_out
+
+    def _yuv_to_rgb_cuda(self, yuv: np.ndarray) -> np.ndarray:
+        stream = self._cuda_stream
+        np.copyto(self._cuda_yuv_host, yuv)
+        self._cuda_yuv.copy_to_device(self._cuda_yuv_host, stream=stream)
+        _yuyv_to_rgb_cuda[self._cuda_grid, _CUDA_BLOCK, stream](
+            self._cuda_yuv, self._cuda_lut, self._cuda_out
+        )
+        if self._kernel_out is None:
+            self._cuda_out.copy_to_host(self._rgb_out, stream=stream)
+            stream.synchronize()
+        else:
+            self._cuda_out.copy_to_host(self._kernel_out, stream=stream)
+            stream.synchronize()
+            np.take(self._out_lut, self._kernel_out, out=self._rgb_out, mode="clip")
+        return self._rgb_out
 
-    def _yuv_to_rgb(self, yuv: np.ndarray) -> np.ndarray:
+    def _yuv_to_rgb(self, yuv: np.ndarray) -> Tuple[bool, np.ndarray]:
         try:
-            y = yuv[:, :, 0].astype(np.float32)
-            uv = yuv[:, :, 1].astype(np.float32)
+            if self._cuda_stream is not None:
+                return True, self._yuv_to_rgb_cuda(yuv)
 
-            y = (y - 16) / 219.0
-            uv = (uv - 128) / 224.0
+            if self._yuyv_kernel is not None:
+                return True, self._run_kernel(self._yuyv_kernel, yuv)
 
-            r = np.clip(y + 1.402 * uv, 0, 1)
-            g = np.clip(y - 0.344136 * uv - 0.714136 * uv, 0, 1)
-            b = np.clip(y + 1.772 * uv, 0, 1)
+            width = self.width
+            v_cols = width // 2
+            y, c = self._fix_scratch
+            rv, guv, bu, t = self._chroma_scratch
+            np.take(_LUT_Y, yuv[:, :, 0], out=y[:, :width], mode="clip")
+            np.take(_LUT_RV, yuv[:, 1::2, 1], out=rv[:, :v_cols], mode="clip")
+            np.take(_LUT_GU, yuv[:, 0::2, 1], out=guv, mode="clip")
+            np.take(_LUT_GV, yuv[:, 1::2, 1], out=t[:, :v_cols], mode="clip")
+            np.take(_LUT_BU, yuv[:, 0::2, 1], out=bu, mode="clip")
+            guv += t
 
-            rgb = np.stack([r, g, b], axis=2)
+            pairs = (self.height, rv.shape[1], 2)
+            y_pairs = y.reshape(pairs)
+            c_pairs = c.reshape(pairs)
+            direct = self.out_dtype == np.uint8
+            rgb = self._rgb_out if direct else self._rgb_u8
+            for channel, (op, chroma) in enumerate(
+                ((np.add, rv), (np.subtract, guv), (np.add, bu))
+            ):
+                op(y_pairs, chroma[:, :, None], out=c_pairs)
+                c >>= _FIX_SHIFT
+                np.clip(c[:, :width], 0, 255, out=rgb[:, :, channel], casting="unsafe")
 
-            return rgb.astype(np.float32)
+            if not direct:
+                np.take(self._out_lut, rgb, out=self._rgb_out, mode="clip")
+            return True, self._rgb_out
 
         except Exception as e:
             logger.error(f"Failed to convert YUV to RGB: {e}")
-            return np.zeros((self.height, self.width, 3), dtype=np.float32)
+            return False, self._zero_frame